@@ -103,10 +103,13 @@ async def main():
     
     batch_verifier = BatchVerifier()
     
-    if args.continuous:
-        await batch_verifier.run_continuous()
-    else:
-        await batch_verifier.run_single_batch()
+    try:
+        if args.continuous:
+            await batch_verifier.run_continuous()
+        else:
+            await batch_verifier.run_single_batch()
+    finally:
+        batch_verifier.verifier.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -8,14 +8,21 @@ import asyncio
 import aiohttp
 import re
 import json
+import csv
+import sys
+import io
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import os
 from dataclasses import dataclass
 from supabase import create_client, Client
 import logging
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -31,6 +38,63 @@ class VerificationResult:
     error: Optional[str] = None
     timestamp: datetime = None
 
+    def to_dict(self, include_bio: bool = False) -> Dict:
+        """
+        Serialize the result for JSONL output
+        """
+        data = {
+            'platform': self.platform,
+            'username': self.username,
+            'verified': self.verified,
+            'code_found': self.code_found,
+            'error': self.error,
+            'timestamp': self.timestamp.isoformat() if self.timestamp else None,
+        }
+        if include_bio:
+            data['bio_text'] = self.bio_text
+        return data
+
+def extract_json_field(body: bytes, field: str, encoding: Optional[str] = None) -> Optional[str]:
+    """
+    Extract a string field embedded as JSON in a raw page body.
+    Searches the raw bytes so only the matched value is decoded, rather than the whole page.
+    """
+    match = re.search(b'"' + re.escape(field.encode('ascii')) + b'":"([^"]*)"', body)
+    if not match:
+        return None
+    text = match.group(1).decode(encoding or 'utf-8', errors='replace')
+    # Decode escaped characters
+    return text.replace('\\n', '\n').replace('\\"', '"').replace('\\\\', '\\')
+
+# Shared HTTP session for the current streaming run, set in the context its tasks run in
+_stream_session: contextvars.ContextVar[Optional[aiohttp.ClientSession]] = contextvars.ContextVar('stream_session', default=None)
+
+class RateLimiter:
+    """
+    Spaces out starts so that at most `rate` happen per second.
+    Call wait() before starting and mark() once started.
+    """
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_start = 0.0
+
+    async def wait(self):
+        delay = self._next_start - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def mark(self):
+        self._next_start = asyncio.get_running_loop().time() + self.interval
+
+@dataclass
+class AccountRecord:
+    platform: str
+    username: str
+    expected_code: Optional[str] = None
+    line: Optional[int] = None
+    # Set when the input row could not be read; the record is reported, not verified
+    error: Optional[str] = None
+
 class BioVerifier:
     def __init__(self):
         # Initialize Supabase client
@@ -49,12 +113,24 @@ class BioVerifier:
                 self.youtube_service = build('youtube', 'v3', developerKey=self.youtube_api_key)
                 logger.info("YouTube API initialized successfully")
             except Exception as e:
-                logger.error(f"Failed to initialize YouTube API: {e}")
+                logger.error(f"Failed to initialize YouTube API, YouTube bios will use web scraping: {e}")
                 self.youtube_service = None
         else:
-            logger.warning("No YouTube API key provided")
+            logger.warning("No YouTube API key provided, YouTube bios will use web scraping")
             self.youtube_service = None
         
+        # Dedicated threads for blocking YouTube API calls, kept apart from the loop's default executor
+        self.youtube_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv('YOUTUBE_API_WORKERS', '4')),
+            thread_name_prefix='youtube-api'
+        )
+        
+        # Hedged fetching: seconds to wait on the preferred source before also trying the next one
+        self.hedge_delay = float(os.getenv('HEDGE_DELAY_SECONDS', '2.0'))
+        # Minutes to skip the YouTube API after it reports quota exhaustion
+        self.youtube_quota_cooldown = int(os.getenv('YOUTUBE_QUOTA_COOLDOWN_MINUTES', '60'))
+        self.youtube_quota_reset_at: Optional[datetime] = None
+        
         # User agents for web scraping (for Instagram/TikTok)
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -65,6 +141,24 @@ class BioVerifier:
         # Verification code pattern
         self.verification_pattern = re.compile(r'cashcore\d{6}', re.IGNORECASE)
 
+    def close(self):
+        """
+        Release the YouTube API threads; queued calls are dropped and in-flight ones are not waited for
+        """
+        self.youtube_executor.shutdown(wait=False, cancel_futures=True)
+
+    @asynccontextmanager
+    async def _http_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        Yield the shared streaming session if one is open, otherwise a short-lived one
+        """
+        session = _stream_session.get()
+        if session is not None:
+            yield session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+
     async def verify_account(self, platform: str, username: str, expected_code: str = None, discord_id: str = None) -> VerificationResult:
         """
         Verify a single account by checking its bio for verification code
@@ -96,6 +190,7 @@ class BioVerifier:
             result = VerificationResult(
                 platform=platform,
                 username=username,
+                verified=False,
                 bio_text=bio_text,
                 timestamp=datetime.now()
             )
@@ -146,7 +241,7 @@ class BioVerifier:
         try:
             url = f"https://www.instagram.com/{username}/"
             
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 headers = {
                     'User-Agent': self.user_agents[0],
                     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -159,15 +254,12 @@ class BioVerifier:
                 
                 async with session.get(url, headers=headers) as response:
                     if response.status == 200:
-                        html = await response.text()
+                        body = await response.read()
                         
                         # Extract bio from Instagram page
                         # Instagram stores bio in a JSON script tag
-                        bio_match = re.search(r'"biography":"([^"]*)"', html)
-                        if bio_match:
-                            bio_text = bio_match.group(1)
-                            # Decode escaped characters
-                            bio_text = bio_text.replace('\\n', '\n').replace('\\"', '"').replace('\\\\', '\\')
+                        bio_text = extract_json_field(body, 'biography', response.charset)
+                        if bio_text is not None:
                             return bio_text
                         else:
                             logger.warning(f"Could not extract bio from Instagram page for {username}")
@@ -187,7 +279,7 @@ class BioVerifier:
         try:
             url = f"https://www.tiktok.com/@{username}"
             
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 headers = {
                     'User-Agent': self.user_agents[0],
                     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -200,15 +292,12 @@ class BioVerifier:
                 
                 async with session.get(url, headers=headers) as response:
                     if response.status == 200:
-                        html = await response.text()
+                        body = await response.read()
                         
                         # Extract bio from TikTok page
                         # TikTok stores user data in a JSON script tag
-                        bio_match = re.search(r'"signature":"([^"]*)"', html)
-                        if bio_match:
-                            bio_text = bio_match.group(1)
-                            # Decode escaped characters
-                            bio_text = bio_text.replace('\\n', '\n').replace('\\"', '"').replace('\\\\', '\\')
+                        bio_text = extract_json_field(body, 'signature', response.charset)
+                        if bio_text is not None:
                             return bio_text
                         else:
                             logger.warning(f"Could not extract bio from TikTok page for {username}")
@@ -221,24 +310,96 @@ class BioVerifier:
             logger.error(f"Error scraping TikTok bio for {username}: {str(e)}")
             return None
 
+    async def _fetch_hedged(self, username: str, sources: List[Callable[[str], Awaitable[Optional[str]]]], hedge_delay: Optional[float] = None) -> Optional[str]:
+        """
+        Fetch a bio from several sources in order of preference, returning the first valid (non-None) result.
+        The next source is started when the running ones have not answered within hedge_delay seconds,
+        or as soon as a source fails, so the fallback only adds load when the preferred source is slow or broken.
+        """
+        if hedge_delay is None:
+            hedge_delay = self.hedge_delay
+        
+        pending = set()
+        next_source = 0
+        
+        def start_next():
+            nonlocal next_source
+            pending.add(asyncio.ensure_future(sources[next_source](username)))
+            next_source += 1
+        
+        start_next()
+        try:
+            while pending:
+                timeout = hedge_delay if next_source < len(sources) else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                
+                if not done:
+                    logger.info(f"No bio for {username} after {hedge_delay}s, also trying {getattr(sources[next_source], '__qualname__', repr(sources[next_source]))}")
+                    start_next()
+                    continue
+                
+                for task in done:
+                    pending.discard(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.warning(f"Bio source failed for {username}: {str(e)}")
+                        result = None
+                    if result is not None:
+                        return result
+                
+                # A source came back empty handed, start the next one right away
+                if next_source < len(sources):
+                    start_next()
+            
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+
     async def _get_youtube_bio(self, username: str) -> Optional[str]:
+        """
+        Get YouTube channel bio, preferring the YouTube Data API and hedging with web scraping
+        """
+        sources = [self._get_youtube_bio_scraping]
+        if self.youtube_service and not self._youtube_quota_exhausted():
+            sources.insert(0, self._get_youtube_bio_api)
+        return await self._fetch_hedged(username, sources)
+
+    def _youtube_quota_exhausted(self) -> bool:
+        return self.youtube_quota_reset_at is not None and datetime.now() < self.youtube_quota_reset_at
+
+    def _handle_youtube_api_error(self, error: HttpError):
+        """
+        Stop using the YouTube API for a cooldown period when its quota runs out
+        """
+        if error.resp.status in (403, 429) and 'quota' in str(error).lower():
+            self.youtube_quota_reset_at = datetime.now() + timedelta(minutes=self.youtube_quota_cooldown)
+            logger.warning(f"YouTube API quota exceeded, using web scraping for the next {self.youtube_quota_cooldown} minutes")
+
+    async def _execute_youtube_request(self, request) -> Dict:
+        """
+        Execute a YouTube API request in a worker thread so it does not block the event loop
+        """
+        loop = asyncio.get_running_loop()
+        # httplib2 connections are not thread safe, so each request gets its own,
+        # built like the client's default transport so it keeps the socket timeout
+        return await loop.run_in_executor(self.youtube_executor, lambda: request.execute(http=build_http()))
+
+    async def _get_youtube_bio_api(self, username: str) -> Optional[str]:
         """
         Get YouTube channel bio using YouTube Data API
         """
         try:
-            if not self.youtube_service:
-                logger.warning("YouTube API service not initialized, falling back to web scraping")
-                return await self._get_youtube_bio_scraping(username)
-            
             # First, try to get channel by username (handle)
             try:
                 # Search for channel by username
-                search_response = self.youtube_service.search().list(
+                search_response = await self._execute_youtube_request(self.youtube_service.search().list(
                     part='snippet',
                     q=username,
                     type='channel',
                     maxResults=1
-                ).execute()
+                ))
                 
                 if not search_response.get('items'):
                     logger.warning(f"No YouTube channel found for username: {username}")
@@ -248,14 +409,15 @@ class BioVerifier:
                 
             except HttpError as e:
                 logger.error(f"YouTube API error searching for channel {username}: {e}")
+                self._handle_youtube_api_error(e)
                 return None
             
             # Get channel details
             try:
-                channel_response = self.youtube_service.channels().list(
+                channel_response = await self._execute_youtube_request(self.youtube_service.channels().list(
                     part='snippet,statistics',
                     id=channel_id
-                ).execute()
+                ))
                 
                 if not channel_response.get('items'):
                     logger.warning(f"No YouTube channel details found for ID: {channel_id}")
@@ -273,6 +435,7 @@ class BioVerifier:
                     
             except HttpError as e:
                 logger.error(f"YouTube API error getting channel details for {username}: {e}")
+                self._handle_youtube_api_error(e)
                 return None
                 
         except Exception as e:
@@ -286,7 +449,7 @@ class BioVerifier:
         try:
             url = f"https://www.youtube.com/@{username}/about"
             
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 headers = {
                     'User-Agent': self.user_agents[0],
                     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -299,15 +462,12 @@ class BioVerifier:
                 
                 async with session.get(url, headers=headers) as response:
                     if response.status == 200:
-                        html = await response.text()
+                        body = await response.read()
                         
                         # Extract description from YouTube channel about page
                         # YouTube stores channel data in JSON-LD
-                        desc_match = re.search(r'"description":"([^"]*)"', html)
-                        if desc_match:
-                            bio_text = desc_match.group(1)
-                            # Decode escaped characters
-                            bio_text = bio_text.replace('\\n', '\n').replace('\\"', '"').replace('\\\\', '\\')
+                        bio_text = extract_json_field(body, 'description', response.charset)
+                        if bio_text is not None:
                             return bio_text
                         else:
                             logger.warning(f"Could not extract bio from YouTube page for {username}")
@@ -429,6 +589,198 @@ class BioVerifier:
             logger.error(f"Error in batch verification: {str(e)}")
             return {}
 
+    async def verify_stream(self, records: Iterable[AccountRecord], concurrency: int = 20, rate: Optional[float] = None) -> AsyncIterator[Tuple[AccountRecord, VerificationResult]]:
+        """
+        Verify accounts from an iterable, yielding results as they complete.
+        At most `concurrency` accounts are in flight and the input is consumed lazily,
+        so memory stays bounded regardless of input size. `rate` caps how many accounts
+        per second are started on each platform (None or 0 for no limit). Records carrying
+        an error are yielded as failed results without being fetched.
+        """
+        concurrency = max(1, concurrency)
+        records = iter(records)
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(concurrency)
+        results: asyncio.Queue = asyncio.Queue()
+        platform_queues: Dict[str, asyncio.Queue] = {}
+        dispatchers: List[asyncio.Task] = []
+        in_flight = set()
+        # The input is read on its own thread so a slow source (e.g. a pipe on stdin) never stalls in-flight fetches
+        reader_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='stream-reader')
+        
+        async def verify_record(record: AccountRecord):
+            if record.error:
+                result = VerificationResult(platform=record.platform, username=record.username, verified=False, error=record.error)
+            else:
+                result = await self.verify_account(record.platform, record.username, record.expected_code)
+            await results.put((record, result))
+        
+        async def dispatch(queue: asyncio.Queue, limiter: Optional[RateLimiter]):
+            # One dispatcher per platform waits out its own rate limit before taking a slot,
+            # so a throttled platform never holds slots other platforms could use
+            while True:
+                record = await queue.get()
+                if record is None:
+                    return
+                if limiter:
+                    await limiter.wait()
+                await slots.acquire()
+                if limiter:
+                    limiter.mark()
+                task = asyncio.ensure_future(verify_record(record))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+        
+        async def read_input():
+            try:
+                while True:
+                    record = await loop.run_in_executor(reader_executor, next, records, None)
+                    if record is None:
+                        break
+                    key = '' if record.error else record.platform.lower()
+                    if key not in platform_queues:
+                        platform_queues[key] = asyncio.Queue(maxsize=concurrency)
+                        limiter = RateLimiter(rate) if rate and not record.error else None
+                        dispatchers.append(asyncio.ensure_future(dispatch(platform_queues[key], limiter)))
+                    await platform_queues[key].put(record)
+                
+                for queue in platform_queues.values():
+                    await queue.put(None)
+                await asyncio.gather(*dispatchers)
+                if in_flight:
+                    await asyncio.wait(set(in_flight))
+                await results.put(None)
+            except Exception as e:
+                await results.put(e)
+        
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Tasks are created inside their own context so concurrent runs each see their own session
+            run_context = contextvars.copy_context()
+            run_context.run(_stream_session.set, session)
+            reader = run_context.run(asyncio.ensure_future, read_input())
+            
+            try:
+                while True:
+                    item = await results.get()
+                    if item is None:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    slots.release()
+                    yield item
+            finally:
+                pending = [reader, *dispatchers, *in_flight]
+                for task in pending:
+                    task.cancel()
+                # Let cancelled tasks finish before the session closes under them
+                await asyncio.gather(*pending, return_exceptions=True)
+                reader_executor.shutdown(wait=False, cancel_futures=True)
+
+def read_account_records(stream, input_format: str = 'jsonl') -> Iterator[AccountRecord]:
+    """
+    Lazily read account records (platform, username, expected code) from a JSONL or CSV stream.
+    Malformed rows are logged and yielded with an error so they still show up in the output.
+    """
+    if input_format == 'csv':
+        rows = _iter_csv_rows(stream)
+    else:
+        rows = _iter_jsonl_rows(stream)
+    
+    for line_number, row, error in rows:
+        if error:
+            logger.warning(f"Skipping line {line_number}: {error}")
+            yield AccountRecord(platform='', username='', line=line_number, error=error)
+            continue
+        platform = (row.get('platform') or '').strip()
+        username = (row.get('username') or '').strip()
+        expected_code = (row.get('expected_code') or row.get('verification_code') or '').strip() or None
+        
+        if not platform or not username:
+            error = "platform and username are required"
+            logger.warning(f"Skipping line {line_number}: {error}")
+            yield AccountRecord(platform=platform, username=username, expected_code=expected_code, line=line_number, error=error)
+            continue
+        
+        yield AccountRecord(platform=platform, username=username, expected_code=expected_code, line=line_number)
+
+def _iter_csv_rows(stream) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    # DictReader skips blank lines and quoted fields may span lines, so take the line from the reader.
+    # reader.line_num is not advanced when a row fails to parse, so count consumed lines as well
+    lines_read = 0
+    
+    def counted_lines():
+        nonlocal lines_read
+        for line in stream:
+            lines_read += 1
+            yield line
+    
+    reader = csv.DictReader(counted_lines())
+    while True:
+        start_line = lines_read + 1
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            yield start_line, None, f"invalid CSV in lines {start_line}-{lines_read} ({e})"
+            continue
+        yield reader.line_num, row, None
+
+def _iter_jsonl_rows(stream) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"invalid JSON ({e})"
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, "expected a JSON object"
+            continue
+        yield line_number, {key: str(value) if value is not None else None for key, value in row.items()}, None
+
+async def run_stream_verification(verifier: BioVerifier, input_path: str, output_path: str, input_format: str = None, concurrency: int = 20, rate: Optional[float] = None, include_bio: bool = False) -> Tuple[int, int]:
+    """
+    Verify accounts read from input_path ('-' for stdin) and write JSONL results to output_path ('-' for stdout).
+    Results are written and flushed as each account completes. Returns (processed, verified) counts.
+    Raises OSError if either file cannot be opened.
+    """
+    if not input_format:
+        input_format = 'csv' if input_path.lower().endswith('.csv') else 'jsonl'
+    
+    if rate:
+        logger.info(f"Rate limited to {rate} accounts/s per platform (about {rate * 3600:.0f} accounts/hour per platform)")
+    
+    processed = 0
+    verified = 0
+    with ExitStack() as stack:
+        # utf-8-sig drops the BOM Excel puts on CSV exports; undecodable bytes are replaced rather than ending the run
+        if input_path == '-':
+            input_stream = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8-sig', errors='replace', newline='')
+            stack.callback(input_stream.detach)
+        else:
+            input_stream = stack.enter_context(open(input_path, 'r', encoding='utf-8-sig', errors='replace', newline=''))
+        output_stream = sys.stdout if output_path == '-' else stack.enter_context(open(output_path, 'w', encoding='utf-8'))
+        
+        records = read_account_records(input_stream, input_format)
+        async for record, result in verifier.verify_stream(records, concurrency, rate):
+            data = result.to_dict(include_bio=include_bio)
+            data['expected_code'] = record.expected_code
+            data['line'] = record.line
+            output_stream.write(json.dumps(data, ensure_ascii=False) + '\n')
+            output_stream.flush()
+            
+            processed += 1
+            if result.verified:
+                verified += 1
+            if processed % 1000 == 0:
+                logger.info(f"Stream verification progress: {processed} processed, {verified} verified")
+    
+    return processed, verified
+
 # CLI interface
 async def main():
     """
@@ -442,54 +794,78 @@ async def main():
     parser.add_argument('--username', help='Username to verify')
     parser.add_argument('--batch', action='store_true', help='Run batch verification for pending accounts')
     parser.add_argument('--limit', type=int, default=10, help='Limit for batch verification')
+    parser.add_argument('--input', help="File of accounts to verify (JSONL or CSV with platform, username, expected_code columns); '-' for stdin")
+    parser.add_argument('--input-format', choices=['jsonl', 'csv'], help='Input format (default: detected from file extension, JSONL for stdin)')
+    parser.add_argument('--output', default='-', help="JSONL file for streamed results; '-' for stdout (default)")
+    parser.add_argument('--concurrency', type=int, default=20, help='Maximum accounts verified concurrently in stream mode')
+    parser.add_argument('--rate', type=float, default=0, help='Maximum accounts started per second on each platform in stream mode (default: no limit; unthrottled scraping of Instagram/TikTok risks rate limits and bans)')
+    parser.add_argument('--include-bio', action='store_true', help='Include bio text in streamed results')
     
     args = parser.parse_args()
     
     verifier = BioVerifier()
-    
-    if args.discord_id:
-        # Verify all accounts for a Discord user
-        results = await verifier.verify_user_accounts(args.discord_id)
+    try:
+        if args.input:
+            # Stream verification from a file or stdin, results go out as JSONL
+            try:
+                processed, verified = await run_stream_verification(
+                    verifier,
+                    args.input,
+                    args.output,
+                    input_format=args.input_format,
+                    concurrency=args.concurrency,
+                    rate=args.rate,
+                    include_bio=args.include_bio
+                )
+            except OSError as e:
+                parser.error(f"stream verification failed: {e}")
+            logger.info(f"Stream verification completed: {verified}/{processed} accounts verified")
         
-        print(f"\nVerification results for Discord user {args.discord_id}:")
-        for platform, platform_results in results.items():
-            print(f"\n{platform.upper()}:")
-            for result in platform_results:
-                status = "✅ VERIFIED" if result.verified else "❌ NOT VERIFIED"
-                print(f"  {result.username}: {status}")
-                if result.code_found:
-                    print(f"    Code found: {result.code_found}")
-                if result.error:
-                    print(f"    Error: {result.error}")
-    
-    elif args.platform and args.username:
-        # Verify single account
-        result = await verifier.verify_account(args.platform, args.username, discord_id=args.discord_id)
+        elif args.discord_id:
+            # Verify all accounts for a Discord user
+            results = await verifier.verify_user_accounts(args.discord_id)
+            
+            print(f"\nVerification results for Discord user {args.discord_id}:")
+            for platform, platform_results in results.items():
+                print(f"\n{platform.upper()}:")
+                for result in platform_results:
+                    status = "✅ VERIFIED" if result.verified else "❌ NOT VERIFIED"
+                    print(f"  {result.username}: {status}")
+                    if result.code_found:
+                        print(f"    Code found: {result.code_found}")
+                    if result.error:
+                        print(f"    Error: {result.error}")
         
-        print(f"\nVerification result for {args.platform}/{args.username}:")
-        status = "✅ VERIFIED" if result.verified else "❌ NOT VERIFIED"
-        print(f"Status: {status}")
-        if result.code_found:
-            print(f"Code found: {result.code_found}")
-        if result.bio_text:
-            print(f"Bio: {result.bio_text[:200]}...")
-        if result.error:
-            print(f"Error: {result.error}")
-    
-    elif args.batch:
-        # Batch verify pending accounts
-        print("Running batch verification...")
-        results = await verifier.batch_verify_pending_accounts(args.limit)
+        elif args.platform and args.username:
+            # Verify single account
+            result = await verifier.verify_account(args.platform, args.username, discord_id=args.discord_id)
+            
+            print(f"\nVerification result for {args.platform}/{args.username}:")
+            status = "✅ VERIFIED" if result.verified else "❌ NOT VERIFIED"
+            print(f"Status: {status}")
+            if result.code_found:
+                print(f"Code found: {result.code_found}")
+            if result.bio_text:
+                print(f"Bio: {result.bio_text[:200]}...")
+            if result.error:
+                print(f"Error: {result.error}")
         
-        print(f"\nBatch verification completed. Processed {len(results)} Discord users:")
-        for discord_id, user_results in results.items():
-            print(f"\nDiscord user {discord_id}:")
-            for result in user_results:
-                status = "✅ VERIFIED" if result.verified else "❌ NOT VERIFIED"
-                print(f"  {result.platform}/{result.username}: {status}")
-    
-    else:
-        parser.print_help()
+        elif args.batch:
+            # Batch verify pending accounts
+            print("Running batch verification...")
+            results = await verifier.batch_verify_pending_accounts(args.limit)
+            
+            print(f"\nBatch verification completed. Processed {len(results)} Discord users:")
+            for discord_id, user_results in results.items():
+                print(f"\nDiscord user {discord_id}:")
+                for result in user_results:
+                    status = "✅ VERIFIED" if result.verified else "❌ NOT VERIFIED"
+                    print(f"  {result.platform}/{result.username}: {status}")
+        
+        else:
+            parser.print_help()
+    finally:
+        verifier.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -55,14 +55,17 @@ def test_verification():
         
         async def test():
             verifier = BioVerifier()
-            # Test with a public Instagram account (you can change this)
-            result = await verifier.verify_account('instagram', 'instagram')
-            
-            print(f"Test result: {result.verified}")
-            if result.bio_text:
-                print(f"Bio text length: {len(result.bio_text)} characters")
-            if result.error:
-                print(f"Error: {result.error}")
+            try:
+                # Test with a public Instagram account (you can change this)
+                result = await verifier.verify_account('instagram', 'instagram')
+                
+                print(f"Test result: {result.verified}")
+                if result.bio_text:
+                    print(f"Bio text length: {len(result.bio_text)} characters")
+                if result.error:
+                    print(f"Error: {result.error}")
+            finally:
+                verifier.close()
         
         asyncio.run(test())
         print("✅ Verification system test completed!")